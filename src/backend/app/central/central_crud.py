@@ -19,6 +19,7 @@ import base64
 import json
 import os
 import pathlib
+import time
 import zlib
 
 # import osm_fieldwork
@@ -424,9 +425,22 @@ def list_submissions(project_id: int, odk_central: project_schemas.ODKCentral =
     return submissions
 
 
+# XForms only change on startup or custom upload, so the list is cached in-process.
+# It also expires, in case the upload was handled by another worker.
+FORM_LIST_CACHE_SECONDS = 300
+_form_list_cache = {"expires": 0.0, "forms": []}
+
+
+def clear_form_list_cache():
+    """Drop the cached XForm list, after the xlsforms table is updated."""
+    _form_list_cache["expires"] = 0.0
+
+
 def get_form_list(db: Session, skip: int, limit: int):
     """Get a list of IDs and titles of XForms from the database.
 
+    The full list is cached for FORM_LIST_CACHE_SECONDS, then paginated.
+
     Args:
         db (Session): The database session.
         skip (int): The number of records to skip before returning results.
@@ -439,22 +453,18 @@ def get_form_list(db: Session, skip: int, limit: int):
         HTTPException: If there is an error querying the database.
     """
     try:
-        forms = (
-            db.query(db_models.DbXForm.id, db_models.DbXForm.title)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-
-        result_dict = []
-        for form in forms:
-            form_dict = {
-                "id": form[0],  # Assuming the first element is the ID
-                "title": form[1],  # Assuming the second element is the title
-            }
-            result_dict.append(form_dict)
-
-        return result_dict
+        if time.monotonic() >= _form_list_cache["expires"]:
+            forms = (
+                db.query(db_models.DbXForm.id, db_models.DbXForm.title)
+                .order_by(db_models.DbXForm.id)
+                .all()
+            )
+            _form_list_cache["forms"] = [
+                {"id": form.id, "title": form.title} for form in forms
+            ]
+            _form_list_cache["expires"] = time.monotonic() + FORM_LIST_CACHE_SECONDS
+
+        return _form_list_cache["forms"][skip : skip + limit]
 
     except Exception as e:
         log.error(e)
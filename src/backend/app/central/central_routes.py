@@ -26,10 +26,9 @@ from sqlalchemy import (
     table,
 )
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
 
 from ..central import central_crud
-from ..db import database
+from ..db import database, db_models
 from ..projects import project_crud, project_schemas
 
 router = APIRouter(
@@ -120,8 +119,7 @@ async def download_submissions(
     project = table(
         "projects", column("project_name_prefix"), column("xform_title"), column("id"), column("odkid")
     )
-    where = f"id={project_id}"
-    sql = select(project).where(text(where))
+    sql = select(project).where(project.c.id == project_id)
     result = db.execute(sql)
     first = result.first()
     if not first:
@@ -166,8 +164,7 @@ async def list_submissions(
         project = table(
             "projects", column("project_name_prefix"), column("xform_title"), column("id"), column("odkid")
         )
-        where = f"id={project_id}"
-        sql = select(project).where(text(where))
+        sql = select(project).where(project.c.id == project_id)
         result = db.execute(sql)
         first = result.first()
         if not first:
@@ -198,8 +195,11 @@ async def list_submissions(
 
         return submissions
     except Exception as e:
-        log.error(e)
-        raise HTTPException(status_code=500, detail=str(e)) from e
+        # Logged only: the error may include query text from the database
+        log.exception(e)
+        raise HTTPException(
+            status_code=500, detail="Failed to get submissions from ODK Central"
+        ) from e
 
 
 @router.get("/submission")
@@ -227,10 +227,10 @@ async def get_submission(
         """Download the submissions data from Central."""
         project = table(
             "projects", column("project_name_prefix"), column("xform_title"), column("id"), column("odkid"),
-            column("odk_central_url"), column("odk_central_user"), column("odk_central_password")
+            column("odk_central_url"), column("odk_central_user"),
+            column("odk_central_password", db_models.EncryptedString)
         )
-        where = f"id={project_id}"
-        sql = select(project).where(text(where))
+        sql = select(project).where(project.c.id == project_id)
         result = db.execute(sql)
         first = result.first()
         if not first:
@@ -285,8 +285,11 @@ async def get_submission(
 
         return submissions
     except Exception as e:
-        log.error(e)
-        raise HTTPException(status_code=500, detail=str(e)) from e
+        # Logged only: the error may include query text from the database
+        log.exception(e)
+        raise HTTPException(
+            status_code=500, detail="Failed to get submissions from ODK Central"
+        ) from e
 
 
 # @router.get("/upload")
@@ -80,6 +80,14 @@ class Settings(BaseSettings):
 
     FMTM_DB_URL: Optional[PostgresDsn] = None
 
+    # Connections per uvicorn worker: (pool size + max overflow) for each
+    # engine, times the worker count, must stay below Postgres max_connections
+    FMTM_DB_POOL_SIZE: int = 10
+    FMTM_DB_MAX_OVERFLOW: int = 5
+    # The async engine only serves the organisation endpoints
+    FMTM_DB_ASYNC_POOL_SIZE: int = 3
+    FMTM_DB_ASYNC_MAX_OVERFLOW: int = 2
+
     @field_validator("FMTM_DB_URL", mode="after")
     @classmethod
     def assemble_db_connection(cls, v: Optional[str], info: FieldValidationInfo) -> Any:
@@ -107,6 +115,18 @@ class Settings(BaseSettings):
     OSM_SCOPE: str = "read_prefs"
     OSM_LOGIN_REDIRECT_URI: str = "http://127.0.0.1:8080/osmauth/"
 
+    ENCRYPTION_KEY: Optional[str] = None
+
+    @field_validator("ENCRYPTION_KEY", mode="after")
+    @classmethod
+    def assemble_encryption_key(
+        cls, v: Optional[str], info: FieldValidationInfo
+    ) -> Optional[str]:
+        """Key for secrets encrypted in the DB, defaulting to the OSM secret key."""
+        if isinstance(v, str) and v:
+            return v
+        return info.data.get("OSM_SECRET_KEY")
+
     UNDERPASS_API_URL: str = "https://raw-data-api0.hotosm.org/v1"
     SENTRY_DSN: Optional[str] = None
 
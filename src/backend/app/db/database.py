@@ -18,15 +18,82 @@
 
 """Config for the FMTM database connection."""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from ..config import settings
 
-engine = create_engine(settings.FMTM_DB_URL)
+# Pool sizes are set per engine from settings. Pre-ping and recycle drop
+# connections closed server side, LIFO keeps a small set of connections warm
+POOL_OPTIONS = {
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
+
+def json_dumps(obj) -> str:
+    """Serialise JSON/JSONB column values with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# orjson (C) rather than stdlib json for JSONB values such as OSM tags
+JSON_OPTIONS = {"json_serializer": json_dumps, "json_deserializer": orjson.loads}
+
+# Session setting holding the key for EncryptedString columns
+ENCRYPTION_KEY_SETTING = "fmtm.encryption_key"
+
+
+def set_encryption_key(dbapi_connection, connection_record):
+    """Set the encryption key on each new connection.
+
+    Set once per connection, rather than bound in each statement, so the key
+    never appears in statement parameters, nor in the errors that show them.
+    """
+    key = settings.ENCRYPTION_KEY.replace("'", "''")
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SELECT set_config('{ENCRYPTION_KEY_SETTING}', '{key}', false)")
+    cursor.close()
+    # Committed, so the pool's rollback on checkin doesn't revert it
+    dbapi_connection.commit()
+
+
+# Cache more compiled statements than the default 500, as the ORM has many
+engine = create_engine(
+    settings.FMTM_DB_URL,
+    query_cache_size=1200,
+    pool_size=settings.FMTM_DB_POOL_SIZE,
+    max_overflow=settings.FMTM_DB_MAX_OVERFLOW,
+    **POOL_OPTIONS,
+    **JSON_OPTIONS,
+)
+event.listen(engine, "connect", set_encryption_key)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Same database via asyncpg, for endpoints that must not block the event loop
+async_engine = create_async_engine(
+    make_url(str(settings.FMTM_DB_URL)).set(drivername="postgresql+asyncpg"),
+    query_cache_size=1200,
+    # JIT compilation only slows down the short queries these endpoints run
+    connect_args={"server_settings": {"jit": "off"}},
+    pool_size=settings.FMTM_DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.FMTM_DB_ASYNC_MAX_OVERFLOW,
+    **POOL_OPTIONS,
+    **JSON_OPTIONS,
+)
+event.listen(async_engine.sync_engine, "connect", set_encryption_key)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 FmtmMetadata = Base.metadata
 
@@ -38,3 +105,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Create SQLAlchemy async DB session."""
+    async with AsyncSessionLocal() as db:
+        yield db
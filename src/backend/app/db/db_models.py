@@ -16,12 +16,21 @@
 #     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
 #
 
-from geoalchemy2 import Geometry
+import io
+from enum import Enum as PyEnum
+from itertools import product
+
+import shapely.wkb as wkblib
+from geoalchemy2 import Geometry, WKBElement
+from geoalchemy2.shape import from_shape, to_shape
+from shapely.geometry.base import BaseGeometry
 from sqlalchemy import (
     ARRAY,
+    DDL,
     BigInteger,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
@@ -31,13 +40,20 @@ from sqlalchemy import (
     LargeBinary,
     String,
     Table,
+    TypeDecorator,
     UniqueConstraint,
     desc,
+    event,
+    func,
+    insert,
+    literal_column,
+    text,
+    type_coerce,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import (  # , declarative_base  # , declarative_base
     backref,
-    object_session,
+    deferred,
     relationship,
 )
 
@@ -55,10 +71,136 @@ from ..models.enums import (
     UserRole,
     ValidationPermission,
 )
-from .database import Base, FmtmMetadata
+from .database import ENCRYPTION_KEY_SETTING, Base, FmtmMetadata, json_dumps
 from .postgis_utils import timestamp
 
 
+# Read from the connection's session, see database.set_encryption_key
+ENCRYPTION_KEY = func.current_setting(literal_column(f"'{ENCRYPTION_KEY_SETTING}'"))
+
+
+class EncryptedString(TypeDecorator):
+    """String stored encrypted with pgcrypto, using the connection's key.
+
+    Values are encrypted and decrypted by the database, so are only ever
+    plaintext in the app, never at rest.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def bind_expression(self, bindvalue):
+        """Encrypt the value on write."""
+        return func.pgp_sym_encrypt(type_coerce(bindvalue, String), ENCRYPTION_KEY)
+
+    def column_expression(self, column):
+        """Decrypt the value on read."""
+        return func.pgp_sym_decrypt(column, ENCRYPTION_KEY, type_=String)
+
+    def result_processor(self, dialect, coltype):
+        """Values are already decrypted to text, so need no processing."""
+        return None
+
+
+def pg_enum(enum_class, **kwargs):
+    """Enum column type, always stored as a native PostgreSQL ENUM.
+
+    Native enums take 4 bytes per value, rather than a varchar + CHECK.
+    Fetched values are decoded with a name to member dict that the Enum type
+    builds once, so no custom decoding type is needed for row heavy tables.
+    """
+    return Enum(enum_class, native_enum=True, validate_strings=True, **kwargs)
+
+
+class BulkCopyMixin:
+    """Bulk insert rows for a model, using PostgreSQL COPY for large batches."""
+
+    # Below this many rows a batched INSERT is faster than setting up a COPY
+    COPY_THRESHOLD = 100
+
+    @classmethod
+    def bulk_copy(cls, session, rows):
+        """Insert many rows at once, without creating ORM objects.
+
+        Args:
+            session (Session): A database session.
+            rows (List[dict]): Column name to value mappings, one per row.
+                Geometries may be shapely geometries or WKBElements.
+        """
+        if not rows:
+            return
+        table = cls.__table__
+        if len(rows) < cls.COPY_THRESHOLD:
+            geometry_columns = [
+                column for column in table.columns if isinstance(column.type, Geometry)
+            ]
+            rows = [dict(row) for row in rows]
+            for row, column in product(rows, geometry_columns):
+                if isinstance(row.get(column.name), BaseGeometry):
+                    row[column.name] = from_shape(row[column.name], column.type.srid)
+            session.execute(insert(cls), rows)
+            return
+
+        given = {name for row in rows for name in row}
+        # COPY skips ORM defaults, so include any column with a client default
+        columns = [
+            column
+            for column in table.columns
+            if column.name in given
+            or (column.default is not None and not column.default.is_sequence)
+        ]
+
+        buffer = io.StringIO()
+        for row in rows:
+            values = [cls._copy_value(column, row) for column in columns]
+            buffer.write("\t".join(values) + "\n")
+        buffer.seek(0)
+
+        column_names = ", ".join(column.name for column in columns)
+        with session.connection().connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table.name} ({column_names}) FROM STDIN", buffer)
+
+    @staticmethod
+    def _copy_value(column, row):
+        """Format a row value as a field in COPY text format."""
+        if column.name in row or column.default is None:
+            value = row.get(column.name)
+        elif column.default.is_callable:
+            value = column.default.arg(None)
+        else:
+            value = column.default.arg
+
+        if value is None:
+            return "\\N"
+        if isinstance(value, WKBElement):
+            value = to_shape(value)
+        if isinstance(value, BaseGeometry):
+            value = wkblib.dumps(value, hex=True, srid=column.type.srid)
+        elif isinstance(value, PyEnum):
+            value = value.name
+        elif isinstance(column.type, JSONB):
+            value = json_dumps(value)
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+
+# Secondary table defining many-to-many join between users and the projects they mapped
+user_projects_mapped = Table(
+    "user_projects_mapped",
+    FmtmMetadata,
+    Column("user_id", BigInteger, ForeignKey("users.id"), primary_key=True),
+    Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
+    # The PK serves lookups by user, this serves lookups by project
+    Index("idx_user_projects_mapped_project_id", "project_id"),
+)
+
+
 class DbUser(Base):
     """A SQLAlchemy model representing a user.
 
@@ -76,7 +218,7 @@ class DbUser(Base):
         tasks_mapped (Integer): The number of tasks mapped by the user.
         tasks_validated (Integer): The number of tasks validated by the user.
         tasks_invalidated (Integer): The number of tasks invalidated by the user.
-        projects_mapped (ARRAY(Integer)): A list of project IDs that the user has mapped.
+        projects_mapped (relationship): A relationship to a list of projects that the user has mapped.
         date_registered (DateTime): The date and time when the user registered.
         last_validation_date (DateTime): The date and time when one of the user's tasks was last validated.
         password (String): The password of the user.
@@ -86,7 +228,7 @@ class DbUser(Base):
 
     id = Column(BigInteger, primary_key=True, index=True)
     username = Column(String, unique=True)
-    role = Column(Enum(UserRole), default=UserRole.MAPPER, nullable=False)
+    role = Column(pg_enum(UserRole), default=UserRole.MAPPER, nullable=False)
 
     name = Column(String)
     city = Column(String)
@@ -96,12 +238,13 @@ class DbUser(Base):
     is_expert = Column(Boolean, default=False)
 
     mapping_level = Column(
-        Enum(MappingLevel), default=MappingLevel.BEGINNER, nullable=False
+        pg_enum(MappingLevel), default=MappingLevel.BEGINNER, nullable=False
     )
     tasks_mapped = Column(Integer, default=0, nullable=False)
     tasks_validated = Column(Integer, default=0, nullable=False)
     tasks_invalidated = Column(Integer, default=0, nullable=False)
-    projects_mapped = Column(ARRAY(Integer))
+    # Not eager loaded, as users are joined onto most queries
+    projects_mapped = relationship("DbProject", secondary=user_projects_mapped)
 
     # mentions_notifications = Column(Boolean, default=True, nullable=False)
     # projects_comments_notifications = Column(
@@ -129,6 +272,11 @@ organisation_managers = Table(
     Column("organisation_id", Integer, ForeignKey("organisations.id"), nullable=False),
     Column("user_id", BigInteger, ForeignKey("users.id"), nullable=False),
     UniqueConstraint("organisation_id", "user_id", name="organisation_user_key"),
+    Index(
+        "idx_organisation_managers_user_id",
+        "user_id",
+        postgresql_include=["organisation_id"],
+    ),
 )
 
 
@@ -143,6 +291,7 @@ class DbOrganisation(Base):
         description (String): A description of the organisation.
         url (String): The URL of the organisation's website.
         type (Enum): The type of organisation.
+        updated_at (DateTime): When the organisation was last modified (UTC).
         managers (relationship): A relationship to a list of managers for this organisation.
     """
 
@@ -155,8 +304,17 @@ class DbOrganisation(Base):
     logo = Column(String)  # URL of a logo
     description = Column(String)
     url = Column(String)
-    type = Column(Enum(OrganisationType), default=OrganisationType.FREE, nullable=False)
+    type = Column(
+        pg_enum(OrganisationType), default=OrganisationType.FREE, nullable=False
+    )
     # subscription_tier = Column(Integer)
+    # Kept current by a trigger, including for Core UPDATE statements
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=timestamp,
+        server_default=text("timezone('utc', now())"),
+    )
 
     managers = relationship(
         DbUser,
@@ -164,6 +322,39 @@ class DbOrganisation(Base):
         backref=backref("organisations", lazy="joined"),
     )
 
+    __table_args__ = (
+        # Backs the case-insensitive duplicate check on create
+        Index(
+            "idx_organisations_name_lower",
+            func.lower(name),
+            unique=True,
+            postgresql_include=["id"],
+        ),
+        {},
+    )
+
+
+# Bump organisations.updated_at on every update, used for HTTP ETags
+organisation_updated_at_ddl = DDL(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = timezone('utc', now());
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER organisations_updated_at
+    BEFORE UPDATE ON organisations
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+    """
+)
+event.listen(
+    DbOrganisation.__table__,
+    "after_create",
+    organisation_updated_at_ddl.execute_if(dialect="postgresql"),
+)
+
 
 class DbTeam(Base):
     """A SQLAlchemy model representing a team.
@@ -191,7 +382,7 @@ class DbTeam(Base):
     description = Column(String)
     invite_only = Column(Boolean, default=False, nullable=False)
     visibility = Column(
-        Enum(TeamVisibility), default=TeamVisibility.PUBLIC, nullable=False
+        pg_enum(TeamVisibility), default=TeamVisibility.PUBLIC, nullable=False
     )
     organisation = relationship(DbOrganisation, backref="teams")
 
@@ -222,10 +413,14 @@ class DbProjectTeams(Base):
     role = Column(Integer, nullable=False)
 
     project = relationship(
-        "DbProject", backref=backref("teams", cascade="all, delete-orphan")
+        "DbProject",
+        lazy="selectin",
+        backref=backref("teams", lazy="selectin", cascade="all, delete-orphan"),
     )
     team = relationship(
-        DbTeam, backref=backref("projects", cascade="all, delete-orphan")
+        DbTeam,
+        lazy="selectin",
+        backref=backref("projects", cascade="all, delete-orphan"),
     )
 
 
@@ -238,7 +433,7 @@ class DbProjectInfo(Base):
         name (String): The name of the project.
         short_description (String): A short description of the project.
         description (String): A description of the project.
-        text_searchable (TSVECTOR): A searchable text field populated by a database trigger.
+        text_searchable (TSVECTOR): A searchable text field generated from the name and descriptions.
         per_task_instructions (String): Instructions for completing tasks in this project.
     """
 
@@ -250,12 +445,17 @@ class DbProjectInfo(Base):
     short_description = Column(String)
     description = Column(String)
     text_searchable = Column(
-        TSVECTOR
-    )  # This contains searchable text and is populated by a DB Trigger
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(name, '') || ' ' || "
+            "coalesce(short_description, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+    )  # This contains searchable text and is generated by the DB
     per_task_instructions = Column(String)
 
     __table_args__ = (
-        Index("textsearch_idx", "text_searchable"),
+        Index("textsearch_idx", "text_searchable", postgresql_using="gin"),
         {},
     )
 
@@ -266,7 +466,7 @@ class DbProjectChat(Base):
     Attributes:
         id (BigInteger): The ID of the chat message.
         project_id (Integer): The ID of the project that this chat message is associated with.
-        user_id (Integer): The ID of the user who posted this chat message.
+        user_id (BigInteger): The ID of the user who posted this chat message.
         time_stamp (DateTime): The date and time when this chat message was posted.
         message (String): The content of this chat message.
         posted_by (relationship): A relationship to the user who posted this chat message.
@@ -275,12 +475,24 @@ class DbProjectChat(Base):
     __tablename__ = "project_chat"
     id = Column(BigInteger, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id"), index=True, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False)
     time_stamp = Column(DateTime, nullable=False, default=timestamp)
     message = Column(String, nullable=False)
 
     # Relationships
-    posted_by = relationship(DbUser, foreign_keys=[user_id])
+    posted_by = relationship(DbUser, foreign_keys=[user_id], lazy="joined")
+
+    __table_args__ = (
+        Index("idx_project_chat_project_time", "project_id", time_stamp.desc()),
+        # Append only, so time order follows physical order and BRIN is enough
+        Index(
+            "idx_project_chat_time_stamp_brin",
+            "time_stamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {},
+    )
 
 
 class DbXForm(Base):
@@ -303,7 +515,7 @@ class DbXForm(Base):
     category = Column(String)
     description = Column(String)
     xml = Column(String)  # Internal form representation
-    xls = Column(LargeBinary)  # Human readable representation
+    xls = deferred(Column(LargeBinary))  # Human readable representation
 
 
 class DbTaskInvalidationHistory(Base):
@@ -343,12 +555,19 @@ class DbTaskInvalidationHistory(Base):
             [task_id, project_id], ["tasks.id", "tasks.project_id"], name="fk_tasks"
         ),
         Index("idx_task_validation_history_composite", "task_id", "project_id"),
+        # Only open invalidations are looked up by user, so index just those
         Index(
-            "idx_task_validation_validator_status_composite",
+            "idx_task_validation_open_by_invalidator",
             "invalidator_id",
-            "is_closed",
+            postgresql_where=text("is_closed = false"),
+            postgresql_include=["task_id", "project_id", "invalidated_date"],
+        ),
+        Index(
+            "idx_task_validation_open_by_mapper",
+            "mapper_id",
+            postgresql_where=text("is_closed = false"),
+            postgresql_include=["task_id", "project_id", "invalidated_date"],
         ),
-        Index("idx_task_validation_mapper_status_composite", "mapper_id", "is_closed"),
         {},
     )
 
@@ -416,20 +635,19 @@ class DbTaskHistory(Base):
     id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id"), index=True)
     task_id = Column(Integer, nullable=False)
-    action = Column(Enum(TaskAction), nullable=False)
+    action = Column(pg_enum(TaskAction), nullable=False)
     action_text = Column(String)
     action_date = Column(DateTime, nullable=False, default=timestamp)
     user_id = Column(
         BigInteger,
         ForeignKey("users.id", name="fk_users"),
-        index=True,
         nullable=False,
     )
     invalidation_history = relationship(
-        DbTaskInvalidationHistory, lazy="dynamic", cascade="all"
+        DbTaskInvalidationHistory, lazy="selectin", cascade="all"
     )
 
-    actioned_by = relationship(DbUser)
+    actioned_by = relationship(DbUser, lazy="joined")
     task_mapping_issues = relationship(DbTaskMappingIssue, cascade="all")
 
     __table_args__ = (
@@ -437,7 +655,21 @@ class DbTaskHistory(Base):
             [task_id, project_id], ["tasks.id", "tasks.project_id"], name="fk_tasks"
         ),
         Index("idx_task_history_composite", "task_id", "project_id"),
-        Index("idx_task_history_project_id_user_id", "user_id", "project_id"),
+        Index(
+            "idx_task_history_project_id_user_id",
+            "user_id",
+            "project_id",
+            postgresql_include=["action", "action_date"],
+        ),
+        # Matches the task_history relationship ordering, to avoid a sort
+        Index("idx_task_history_ordered", "project_id", "task_id", action_date.desc()),
+        # Append only, so time order follows physical order and BRIN is enough
+        Index(
+            "idx_task_history_action_date_brin",
+            "action_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         {},
     )
 
@@ -458,7 +690,7 @@ class DbQrCode(Base):
     image = Column(LargeBinary)
 
 
-class DbTask(Base):
+class DbTask(BulkCopyMixin, Base):
     """A SQLAlchemy model representing an individual mapping Task.
 
     Attributes:
@@ -481,16 +713,10 @@ class DbTask(Base):
     outline = Column(Geometry("POLYGON", srid=4326))
     geometry_geojson = Column(String)
     initial_feature_count = Column(Integer)
-    task_status = Column(Enum(TaskStatus), default=TaskStatus.READY)
-    locked_by = Column(
-        BigInteger, ForeignKey("users.id", name="fk_users_locked"), index=True
-    )
-    mapped_by = Column(
-        BigInteger, ForeignKey("users.id", name="fk_users_mapper"), index=True
-    )
-    validated_by = Column(
-        BigInteger, ForeignKey("users.id", name="fk_users_validator"), index=True
-    )
+    task_status = Column(pg_enum(TaskStatus), default=TaskStatus.READY)
+    locked_by = Column(BigInteger, ForeignKey("users.id", name="fk_users_locked"))
+    mapped_by = Column(BigInteger, ForeignKey("users.id", name="fk_users_mapper"))
+    validated_by = Column(BigInteger, ForeignKey("users.id", name="fk_users_validator"))
 
     # Mapped objects
     qr_code_id = Column(Integer, ForeignKey("qr_code.id"), index=True)
@@ -501,9 +727,32 @@ class DbTask(Base):
     task_history = relationship(
         DbTaskHistory, cascade="all", order_by=desc(DbTaskHistory.action_date)
     )
+    # Loaded with joinedload where tasks are rendered, not on every task load
     lock_holder = relationship(DbUser, foreign_keys=[locked_by])
     mapper = relationship(DbUser, foreign_keys=[mapped_by])
 
+    __table_args__ = (
+        # Serves filtering a project's tasks by status
+        Index("idx_tasks_project_status", "project_id", "task_status"),
+        # Cover the columns needed when listing a user's tasks
+        Index(
+            "idx_tasks_locked_by_cover",
+            "locked_by",
+            postgresql_include=["project_id", "task_status"],
+        ),
+        Index(
+            "idx_tasks_mapped_by_cover",
+            "mapped_by",
+            postgresql_include=["project_id", "task_status"],
+        ),
+        Index(
+            "idx_tasks_validated_by_cover",
+            "validated_by",
+            postgresql_include=["project_id", "task_status"],
+        ),
+        {},
+    )
+
     ## ---------------------------------------------- ##
     # FOR REFERENCE: OTHER ATTRIBUTES IN TASKING MANAGER
     # x = Column(Integer)
@@ -527,10 +776,10 @@ class DbProject(Base):
     author_id = Column(
         BigInteger, ForeignKey("users.id", name="fk_users"), nullable=False
     )
-    author = relationship(DbUser)
+    author = relationship(DbUser, lazy="joined")
     created = Column(DateTime, default=timestamp, nullable=False)
     task_creation_mode = Column(
-        Enum(TaskCreationMode), default=TaskCreationMode.UPLOAD, nullable=False
+        pg_enum(TaskCreationMode), default=TaskCreationMode.UPLOAD, nullable=False
     )
     # split_strategy = Column(Integer)
     # grid_meters = Column(Integer)
@@ -541,64 +790,47 @@ class DbProject(Base):
     project_name_prefix = Column(String)
     task_type_prefix = Column(String)
     project_info = relationship(
-        DbProjectInfo, cascade="all, delete, delete-orphan", backref="project"
+        DbProjectInfo,
+        lazy="selectin",
+        cascade="all, delete, delete-orphan",
+        backref="project",
     )
     location_str = Column(String)
 
     # GEOMETRY
+    # geoalchemy2 creates a GiST index (idx_<table>_<column>) per Geometry column
     outline = Column(Geometry("POLYGON", srid=4326))
     # geometry = Column(Geometry("POLYGON", srid=4326, from_text='ST_GeomFromWkt'))
 
     # PROJECT STATUS
     last_updated = Column(DateTime, default=timestamp)
-    status = Column(Enum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
+    status = Column(pg_enum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
     total_tasks = Column(Integer)
-    # tasks_mapped = Column(Integer, default=0, nullable=False)
-    # tasks_validated = Column(Integer, default=0, nullable=False)
-    # tasks_bad_imagery = Column(Integer, default=0, nullable=False)
+    # Task status counters, kept up to date by the tasks_status_counts trigger
+    tasks_mapped = Column(Integer, default=0, server_default="0", nullable=False)
+    tasks_validated = Column(Integer, default=0, server_default="0", nullable=False)
+    tasks_bad = Column(Integer, default=0, server_default="0", nullable=False)
 
     # TASKS
+    # Lazy, as most project loads only need the ODK credentials; queries that
+    # render tasks use project_crud.PROJECT_TASKS_LOADER
     tasks = relationship(
         DbTask, backref="projects", cascade="all, delete, delete-orphan"
     )
 
-    @property
-    def tasks_mapped(self):
-        return (
-            object_session(self)
-            .query(DbTask)
-            .filter(DbTask.task_status == TaskStatus.MAPPED)
-            .with_parent(self)
-            .count()
-        )
-
-    @property
-    def tasks_validated(self):
-        return (
-            object_session(self)
-            .query(DbTask)
-            .filter(DbTask.task_status == TaskStatus.VALIDATED)
-            .with_parent(self)
-            .count()
-        )
-
-    @property
-    def tasks_bad(self):
-        return (
-            object_session(self)
-            .query(DbTask)
-            .filter(DbTask.task_status == TaskStatus.BAD)
-            .with_parent(self)
-            .count()
-        )
-
     # XFORM DETAILS
     odk_central_src = Column(String, default="")  # TODO Add HOTs as default
     xform_title = Column(String, ForeignKey("xlsforms.title", name="fk_xform"))
     xform = relationship(DbXForm)
 
     __table_args__ = (
-        Index("idx_geometry", outline, postgresql_using="gist"),
+        # last_updated is changed in place, so isn't correlated enough for BRIN
+        Index(
+            "idx_projects_created_brin",
+            "created",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         {},
     )
 
@@ -607,18 +839,20 @@ class DbProject(Base):
     # PROJECT ACCESS
     private = Column(Boolean, default=False)  # Only allowed users can validate
     mapper_level = Column(
-        Enum(MappingLevel),
+        pg_enum(MappingLevel),
         default=MappingLevel.INTERMEDIATE,
         nullable=False,
         index=True,
     )  # Mapper level project is suitable for
-    priority = Column(Enum(ProjectPriority), default=ProjectPriority.MEDIUM)
+    priority = Column(pg_enum(ProjectPriority), default=ProjectPriority.MEDIUM)
     featured = Column(
         Boolean, default=False
     )  # Only admins can set a project as featured
-    mapping_permission = Column(Enum(MappingPermission), default=MappingPermission.ANY)
+    mapping_permission = Column(
+        pg_enum(MappingPermission), default=MappingPermission.ANY
+    )
     validation_permission = Column(
-        Enum(ValidationPermission), default=ValidationPermission.LEVEL
+        pg_enum(ValidationPermission), default=ValidationPermission.LEVEL
     )  # Means only users with validator role can validate
     allowed_users = relationship(DbUser, secondary=project_allowed_users)
     organisation_id = Column(
@@ -629,41 +863,98 @@ class DbProject(Base):
     organisation = relationship(DbOrganisation, backref="projects")
     # PROJECT DETAILS
     due_date = Column(DateTime)
-    changeset_comment = Column(String)
-    osmcha_filter_id = Column(
-        String
+    # Columns in the "cold" group are not needed for project listings, so are
+    # only loaded (all together) on first access, or with undefer_group("cold")
+    changeset_comment = deferred(Column(String), group="cold")
+    osmcha_filter_id = deferred(
+        Column(String), group="cold"
     )  # Optional custom filter id for filtering on OSMCha
-    imagery = Column(String)
-    osm_preset = Column(String)
-    odk_preset = Column(String)
-    josm_preset = Column(String)
-    id_presets = Column(ARRAY(String))
-    extra_id_params = Column(String)
+    imagery = deferred(Column(String), group="cold")
+    osm_preset = deferred(Column(String), group="cold")
+    odk_preset = deferred(Column(String), group="cold")
+    josm_preset = deferred(Column(String), group="cold")
+    id_presets = deferred(Column(ARRAY(String)), group="cold")
+    extra_id_params = deferred(Column(String), group="cold")
     license_id = Column(Integer, ForeignKey("licenses.id", name="fk_licenses"))
     # GEOMETRY
     centroid = Column(Geometry("POINT", srid=4326))
     # country = Column(ARRAY(String), default=[])
     # FEEDBACK
-    project_chat = relationship(DbProjectChat, lazy="dynamic", cascade="all")
+    # Not eager loaded by default, as chat grows unbounded; use selectinload
+    project_chat = relationship(DbProjectChat, cascade="all")
 
     ## Odk central server
-    odk_central_url = Column(String)
-    odk_central_user = Column(String)
-    odk_central_password = Column(String)
+    odk_central_url = deferred(Column(String), group="cold")
+    odk_central_user = deferred(Column(String), group="cold")
+    odk_central_password = deferred(Column(EncryptedString), group="cold")
 
     # Count of tasks where osm extracts is completed, used for progress bar.
     extract_completed_count = Column(Integer, default=0)
 
-    form_xls = Column(LargeBinary)  # XLSForm file if custom xls is uploaded
-    form_config_file = Column(LargeBinary)  # Yaml config file if custom xls is uploaded
+    # Files are deferred, so they're only loaded on access, not with every project
+    form_xls = deferred(Column(LargeBinary))  # XLSForm file if custom xls is uploaded
+    form_config_file = deferred(
+        Column(LargeBinary)
+    )  # Yaml config file if custom xls is uploaded
 
     data_extract_type = Column(String)  # Type of data extract (Polygon or Centroid)
     task_split_type = Column(String)  # Type of split (Grid or Feature)
     hashtags = Column(ARRAY(String))  # Project hashtag
 
 
-# TODO: Add index on project geometry, tried to add in __table args__
-# Index("idx_geometry", DbProject.geometry, postgresql_using="gist")
+# pgcrypto provides the encryption used by EncryptedString columns
+event.listen(
+    FmtmMetadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pgcrypto").execute_if(dialect="postgresql"),
+)
+
+# Keep the project task status counters in sync with the tasks table
+project_task_counts_ddl = DDL(
+    """
+    CREATE OR REPLACE FUNCTION update_project_task_counts() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE projects SET
+                tasks_mapped = tasks_mapped - (OLD.task_status = 'MAPPED')::int,
+                tasks_validated =
+                    tasks_validated - (OLD.task_status = 'VALIDATED')::int,
+                tasks_bad = tasks_bad - (OLD.task_status = 'BAD')::int
+            WHERE id = OLD.project_id
+                AND OLD.task_status IN ('MAPPED', 'VALIDATED', 'BAD');
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE projects SET
+                tasks_mapped = tasks_mapped + (NEW.task_status = 'MAPPED')::int,
+                tasks_validated =
+                    tasks_validated + (NEW.task_status = 'VALIDATED')::int,
+                tasks_bad = tasks_bad + (NEW.task_status = 'BAD')::int
+            WHERE id = NEW.project_id
+                AND NEW.task_status IN ('MAPPED', 'VALIDATED', 'BAD');
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER tasks_status_counts
+    AFTER INSERT OR DELETE ON tasks
+    FOR EACH ROW EXECUTE FUNCTION update_project_task_counts();
+
+    CREATE TRIGGER tasks_status_counts_update
+    AFTER UPDATE OF task_status, project_id ON tasks
+    FOR EACH ROW
+    WHEN (
+        OLD.task_status IS DISTINCT FROM NEW.task_status
+        OR OLD.project_id IS DISTINCT FROM NEW.project_id
+    )
+    EXECUTE FUNCTION update_project_task_counts();
+    """
+)
+event.listen(
+    DbTask.__table__,
+    "after_create",
+    project_task_counts_ddl.execute_if(dialect="postgresql"),
+)
 
 # Secondary table defining the many-to-many join
 user_licenses_table = Table(
@@ -690,13 +981,14 @@ class DbLicense(Base):
     )  # Many to Many relationship
 
 
-class DbFeatures(Base):
+class DbFeatures(BulkCopyMixin, Base):
     """Features extracted from osm data."""
 
     __tablename__ = "features"
 
-    id = Column(Integer, primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id"))
+    # Table is hash partitioned on project_id, so it must be part of the PK
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
     project = relationship(DbProject, backref="features")
 
     category_title = Column(String, ForeignKey("xlsforms.title", name="fk_xform"))
@@ -710,7 +1002,26 @@ class DbFeatures(Base):
             [task_id, project_id], ["tasks.id", "tasks.project_id"], name="fk_tasks"
         ),
         Index("idx_features_composite", "task_id", "project_id"),
-        {},
+        Index(
+            "idx_features_properties",
+            "properties",
+            postgresql_using="gin",
+            postgresql_ops={"properties": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "HASH (project_id)"},
+    )
+
+
+# Fixed hash partitions, so no DDL is needed as projects are created
+FEATURES_PARTITIONS = 16
+for remainder in range(FEATURES_PARTITIONS):
+    event.listen(
+        DbFeatures.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE features_p{remainder} PARTITION OF features "
+            f"FOR VALUES WITH (MODULUS {FEATURES_PARTITIONS}, REMAINDER {remainder})"
+        ).execute_if(dialect="postgresql"),
     )
 
 
@@ -729,7 +1040,7 @@ class BackgroundTasks(Base):
     id = Column(String, primary_key=True)
     name = Column(String)
     project_id = Column(Integer, nullable=True)
-    status = Column(Enum(BackgroundTaskStatus), nullable=False)
+    status = Column(pg_enum(BackgroundTaskStatus), nullable=False)
     message = Column(String)
 
 
@@ -754,7 +1065,7 @@ class DbUserRoles(Base):
     organization = relationship(DbOrganisation, backref="user_roles")
     project_id = Column(Integer, ForeignKey("projects.id"))
     project = relationship(DbProject, backref="user_roles")
-    role = Column(Enum(UserRole), nullable=False)
+    role = Column(pg_enum(UserRole), nullable=False)
 
 
 class DbProjectAOI(Base):
@@ -774,6 +1085,16 @@ class DbProjectAOI(Base):
     geom = Column(Geometry(geometry_type="GEOMETRY", srid=4326))
     tags = Column(JSONB)
 
+    __table_args__ = (
+        Index(
+            "idx_project_aoi_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        {},
+    )
+
 
 class DbOsmLines(Base):
     """A SQLAlchemy model representing OSM lines for a project.
@@ -792,6 +1113,16 @@ class DbOsmLines(Base):
     geom = Column(Geometry(geometry_type="GEOMETRY", srid=4326))
     tags = Column(JSONB)
 
+    __table_args__ = (
+        Index(
+            "idx_ways_line_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        {},
+    )
+
 
 class DbBuildings(Base):
     """A SQLAlchemy model representing buildings for a project.
@@ -799,18 +1130,38 @@ class DbBuildings(Base):
     Attributes:
         id (Integer): The ID of the building.
         project_id (String): The ID of the project that this building is associated with.
-        osm_id (String): The OSM ID of this building, if any.
+            A UUID while splitting an AOI before the project exists, so no foreign key.
+        osm_id (BigInteger): The OSM ID of this building, if any.
         geom (Geometry(geometry_type="GEOMETRY", srid=4326)): The geometry of this building in WGS84 coordinates.
+        centroid (Geometry(geometry_type="POINT", srid=4326)): Centroid of geom, generated by the database.
     """
 
     __tablename__ = "ways_poly"
 
     id = Column(Integer, primary_key=True)
     project_id = Column(String)
-    osm_id = Column(String)
-    geom = Column(Geometry(geometry_type="GEOMETRY", srid=4326))
+    osm_id = Column(BigInteger)
+    # SP-GiST suits the heavily overlapping building polygons better than GiST
+    geom = Column(Geometry(geometry_type="GEOMETRY", srid=4326, spatial_index=False))
+    # Stored once on write, rather than calling ST_Centroid in every query
+    centroid = Column(
+        Geometry(geometry_type="POINT", srid=4326),
+        Computed("ST_Centroid(geom)", persisted=True),
+    )
     tags = Column(JSONB)
 
+    __table_args__ = (
+        Index("idx_ways_poly_geom", "geom", postgresql_using="spgist"),
+        Index("idx_ways_poly_project_id_osm_id", "project_id", "osm_id"),
+        Index(
+            "idx_ways_poly_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        {},
+    )
+
 
 class DbTilesPath(Base):
     """A SQLAlchemy model representing the path to an MBTiles file for a project.
@@ -828,9 +1179,24 @@ class DbTilesPath(Base):
     __tablename__ = "mbtiles_path"
 
     id = Column(Integer, primary_key=True)
-    project_id = Column(Integer)
-    status = Column(Enum(BackgroundTaskStatus), nullable=False)
+    project_id = Column(
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    status = Column(pg_enum(BackgroundTaskStatus), nullable=False)
     path = Column(String)
     tile_source = Column(String)
     background_task_id = Column(String)
     created_at = Column(DateTime, default=timestamp)
+
+    __table_args__ = (
+        Index(
+            "idx_mbtiles_path_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {},
+    )
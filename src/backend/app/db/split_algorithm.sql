@@ -80,7 +80,7 @@ DROP TABLE IF EXISTS buildings;
 CREATE TABLE buildings AS (
 SELECT b.*, polys.polyid 
 FROM "ways_poly" b, polygonsnocount polys
-WHERE ST_Intersects(polys.geom, ST_Centroid(b.geom))
+WHERE ST_Intersects(polys.geom, b.centroid)
 AND b.tags->>'building' IS NOT NULL
 );
 
@@ -28,12 +28,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from loguru import logger as log
 from osm_fieldwork.xlsforms import xlsforms_path
+from sqlalchemy import text
 
 from .__version__ import __version__
 from .auth import auth_routes
 from .central import central_routes
 from .config import settings
-from .db.database import Base, engine, get_db
+from .db.database import Base, async_engine, engine, get_db
 from .organization import organization_routes
 from .projects import project_routes
 from .projects.project_crud import read_xlsforms
@@ -174,6 +175,9 @@ async def startup_event():
     log.debug("Starting up FastAPI server.")
     log.debug("Connecting to DB with SQLAlchemy")
     Base.metadata.create_all(bind=engine)
+    # Open the first asyncpg connection now, not on the first request
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
     # Read in XLSForms
     read_xlsforms(next(get_db()), xlsforms_path)
@@ -183,6 +187,7 @@ async def startup_event():
 async def shutdown_event():
     """Commands to run on server shutdown."""
     log.debug("Shutting down FastAPI server.")
+    await async_engine.dispose()
 
 
 @api.get("/")
@@ -19,30 +19,132 @@ import os
 import random
 import re
 import string
+from typing import Optional
 
 from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger as log
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Integer,
+    String,
+    Text,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import db_models
+from ..models.enums import OrganisationType
 
 IMAGEDIR = "app/images/"
+LOGO_CHUNK_SIZE = 64 * 1024
+MAX_LOGO_SIZE = 5 * 1024 * 1024
 
 
-def get_organisations(
-    db: Session,
-):
-    """Retrieve a list of organisations from the database.
+def organisation_json(*columns):
+    """Build a JSON object of organisation columns in Postgres.
+
+    The type enum is emitted as its integer value, as the API has always
+    returned it, rather than the label Postgres would use.
+
+    Args:
+        columns: organisation columns to include, keyed by column name.
+
+    Returns:
+        A json_build_object SQL expression.
+    """
+    pairs = []
+    for column in columns:
+        value = column
+        if column.key == "type":
+            value = case(
+                *[
+                    (column == member.name, literal_column(str(member.value)))
+                    for member in OrganisationType
+                ]
+            )
+        pairs += [literal_column(f"'{column.key}'"), value]
+    return func.json_build_object(*pairs)
+
+
+# Statements are built once, with values bound per call, so requests skip
+# query construction and always hit the same compiled cache entry
+_org = db_models.DbOrganisation
+_page_limit = bindparam("limit", type_=Integer)
+_organisation_page = (
+    select(
+        _org.id,
+        # Only the columns the list view displays
+        organisation_json(
+            _org.id, _org.name, _org.slug, _org.logo, _org.description, _org.url
+        ).label("item"),
+    )
+    # Keyset pagination on the primary key, constant cost unlike OFFSET
+    .where(_org.id > bindparam("after"))
+    .order_by(_org.id)
+    .limit(_page_limit)
+    .subquery()
+)
+ORGANISATION_LIST_QUERY = select(
+    cast(
+        func.json_build_object(
+            literal_column("'items'"),
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        _organisation_page.c.item, _organisation_page.c.id
+                    )
+                ),
+                literal_column("'[]'::json"),
+            ),
+            # A full page may be followed by another, so return its cursor
+            literal_column("'next'"),
+            case(
+                (func.count() == _page_limit, func.max(_organisation_page.c.id)),
+            ),
+        ),
+        Text,
+    )
+)
+ORGANISATION_DETAIL_QUERY = select(
+    _org.updated_at, cast(organisation_json(*_org.__table__.c), Text)
+).where(_org.id == bindparam("id"))
+# An index only scan of idx_organisations_name_lower, which includes the id
+ORGANISATION_ID_BY_NAME_QUERY = (
+    select(_org.id)
+    .where(func.lower(_org.name) == func.lower(bindparam("name", type_=String)))
+    .limit(1)
+)
+
+
+async def get_organisations(
+    db: AsyncSession,
+    after: int = 0,
+    limit: int = 100,
+) -> str:
+    """Retrieve a page of organisations from the database, ordered by id.
+
+    The JSON page is built by Postgres, so rows are never loaded as ORM
+    objects or serialised in Python.
 
     Args:
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
+        after (int): Only return organisations with an id greater than this.
+        limit (int): Maximum number of organisations to return.
 
     Returns:
-        List[DbOrganisation]: A list of organisation records from the database.
+        str: JSON object with the organisations, with only the listed fields,
+            as items, and the after cursor for the next page, or null, as next.
     """
-    db_organisation = db.query(db_models.DbOrganisation).all()
-    return db_organisation
+    return await db.scalar(ORGANISATION_LIST_QUERY, {"after": after, "limit": limit})
 
 
 def generate_slug(text: str) -> str:
@@ -63,23 +165,26 @@ def generate_slug(text: str) -> str:
     return slug
 
 
-async def get_organisation_by_name(db: Session, name: str):
-    # Use SQLAlchemy's query-building capabilities
-    db_organisation = (
-        db.query(db_models.DbOrganisation)
-        .filter(func.lower(db_models.DbOrganisation.name).like(func.lower(f"%{name}%")))
-        .first()
-    )
-    return db_organisation
+async def get_organisation_by_name(db: AsyncSession, name: str) -> Optional[int]:
+    """Get the id of the organization with the given name, ignoring case.
 
+    Args:
+        db (AsyncSession): database session
+        name (str): name of the organization
 
-async def upload_image(db: Session, file: UploadFile(None)):
+    Returns:
+        int: id of the organization, or None if not found
+    """
+    return await db.scalar(ORGANISATION_ID_BY_NAME_QUERY, {"name": name})
+
+
+async def upload_image(db: AsyncSession, file: UploadFile(None)):
     """Upload an image file.
 
     This function saves an uploaded image file to the specified directory and returns the filename.
 
     Args:
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
         file (UploadFile): The uploaded image file.
 
     Returns:
@@ -97,18 +202,43 @@ async def upload_image(db: Session, file: UploadFile(None)):
         filename = f"{logo_name}_{random_char}{extension}"
         file_path = f"{IMAGEDIR}{filename}"
 
-    # Read the file contents
-    contents = await file.read()
-
-    # Save the file
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Stream to disk in chunks, so the whole file is never held in memory.
+    # File IO runs in the threadpool, so it doesn't block the event loop.
+    size = 0
+    f = await run_in_threadpool(open, file_path, "wb")
+    try:
+        while chunk := await file.read(LOGO_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_LOGO_SIZE:
+                break
+            await run_in_threadpool(f.write, chunk)
+    finally:
+        await run_in_threadpool(f.close)
+
+    if size > MAX_LOGO_SIZE:
+        await run_in_threadpool(os.remove, file_path)
+        raise HTTPException(
+            status_code=413,
+            detail=f"Logo exceeds the maximum size of {MAX_LOGO_SIZE} bytes",
+        )
 
     return filename
 
 
+def remove_image(filename: Optional[str]):
+    """Delete an uploaded image that ended up unused, if there is one.
+
+    Args:
+        filename (str): The filename returned by upload_image, or None.
+    """
+    if filename:
+        file_path = f"{IMAGEDIR}{filename}"
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
 async def create_organization(
-    db: Session, name: str, description: str, url: str, logo: UploadFile(None)
+    db: AsyncSession, name: str, description: str, url: str, logo: UploadFile(None)
 ):
     """Creates a new organization with the given name, description, url, type, and logo.
     Saves the logo file to the app/images folder.
@@ -125,6 +255,7 @@ async def create_organization(
         bool: True if organization was created successfully
     """
     # create new organization
+    logo_name = None
     try:
         logo_name = await upload_image(db, logo) if logo else None
 
@@ -137,10 +268,14 @@ async def create_organization(
         )
 
         db.add(db_organization)
-        db.commit()
-        db.refresh(db_organization)
+        await db.commit()
+        await db.refresh(db_organization)
+    except HTTPException:
+        # Already a client error, e.g. an oversized logo
+        raise
     except Exception as e:
         log.error(e)
+        remove_image(logo_name)
         raise HTTPException(
             status_code=400, detail=f"Error creating organization: {e}"
         ) from e
@@ -148,7 +283,7 @@ async def create_organization(
     return True
 
 
-async def get_organisation_by_id(db: Session, id: int):
+async def get_organisation_by_id(db: AsyncSession, id: int):
     """Get an organization by its id.
 
     Args:
@@ -158,35 +293,108 @@ async def get_organisation_by_id(db: Session, id: int):
     Returns:
         DbOrganisation: organization with the given id
     """
-    db_organization = (
-        db.query(db_models.DbOrganisation)
-        .filter(db_models.DbOrganisation.id == id)
-        .first()
-    )
+    db_organization = await db.get(db_models.DbOrganisation, id)
     return db_organization
 
 
+async def get_organisation_json_by_id(db: AsyncSession, id: int):
+    """Get an organization by its id, as JSON built by Postgres.
+
+    Args:
+        db (AsyncSession): database session
+        id (int): id of the organization
+
+    Returns:
+        Row: (updated_at, json) for the organization, or None if not found
+    """
+    result = await db.execute(ORGANISATION_DETAIL_QUERY, {"id": id})
+    return result.first()
+
+
 async def update_organization_info(
-    db: Session,
+    db: AsyncSession,
     organization_id,
     name: str,
     description: str,
     url: str,
     logo: UploadFile,
 ):
-    organization = await get_organisation_by_id(db, organization_id)
-    if not organization:
-        raise HTTPException(status_code=404, detail="Organization not found")
-
+    values = {}
     if name:
-        organization.name = name
+        values["name"] = name
     if description:
-        organization.description = description
+        values["description"] = description
     if url:
-        organization.url = url
+        values["url"] = url
     if logo:
-        organization.logo = await upload_image(db, logo) if logo else None
+        values["logo"] = await upload_image(db, logo)
+
+    if values:
+        # Single UPDATE ... RETURNING rather than load, mutate, then refresh
+        try:
+            organization = await db.scalar(
+                update(db_models.DbOrganisation)
+                .where(db_models.DbOrganisation.id == organization_id)
+                .values(**values)
+                .returning(db_models.DbOrganisation)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            remove_image(values.get("logo"))
+            log.error(f"Failed to update organization {organization_id}: {e}")
+            raise HTTPException(
+                status_code=409, detail="Organization name already exists"
+            ) from e
+    else:
+        organization = await get_organisation_by_id(db, organization_id)
 
-    db.commit()
-    db.refresh(organization)
+    if not organization:
+        # Nothing was updated, so the uploaded logo is not referenced
+        remove_image(values.get("logo"))
+        raise HTTPException(status_code=404, detail="Organization not found")
     return organization
+
+
+async def delete_organisation(db: AsyncSession, organization_id: int):
+    """Delete an organization, unlinking its managers, projects and user roles.
+
+    Args:
+        db (AsyncSession): database session
+        organization_id (int): id of the organization
+
+    Returns:
+        int: id of the deleted organization, or None if it did not exist
+    """
+    # Mirror what the ORM did through the managers, projects and user_roles
+    # relationships: drop manager links and null out the other references
+    try:
+        await db.execute(
+            delete(db_models.organisation_managers).where(
+                db_models.organisation_managers.c.organisation_id == organization_id
+            )
+        )
+        await db.execute(
+            update(db_models.DbProject)
+            .where(db_models.DbProject.organisation_id == organization_id)
+            .values(organisation_id=None)
+        )
+        await db.execute(
+            update(db_models.DbUserRoles)
+            .where(db_models.DbUserRoles.organization_id == organization_id)
+            .values(organization_id=None)
+        )
+        deleted_id = await db.scalar(
+            delete(db_models.DbOrganisation)
+            .where(db_models.DbOrganisation.id == organization_id)
+            .returning(db_models.DbOrganisation.id)
+        )
+        await db.commit()
+    except IntegrityError as e:
+        # e.g. teams, which must belong to an organization
+        await db.rollback()
+        log.error(f"Failed to delete organization {organization_id}: {e}")
+        raise HTTPException(
+            status_code=409, detail="Organization is still in use by its teams"
+        ) from e
+    return deleted_id
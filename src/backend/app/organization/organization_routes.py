@@ -17,53 +17,98 @@
 #
 
 
+from typing import Optional
+
 from fastapi import (
     APIRouter,
     Depends,
     File,
     Form,
     HTTPException,
+    Query,
+    Request,
+    Response,
     UploadFile,
 )
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import database
-from . import organization_crud
+from . import organization_crud, organization_schemas
 
 router = APIRouter(
     prefix="/organization",
     tags=["organization"],
-    dependencies=[Depends(database.get_db)],
+    default_response_class=ORJSONResponse,
     responses={404: {"description": "Not found"}},
 )
 
 
-@router.get("/")
-def get_organisations(
-    db: Session = Depends(database.get_db),
+@router.get("/", response_model=organization_schemas.OrganisationPage)
+async def get_organisations(
+    after: int = Query(
+        0, ge=0, description="Cursor: the last organization id of the previous page"
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum page size"),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    """Get the list of organizations.
+    """Get the list of organizations, a page at a time.
 
     Args:
-        db (Session): SQLAlchemy database session.
+        after (int): Return organizations with ids after this one.
+        limit (int): Maximum number of organizations to return.
+        db (AsyncSession): SQLAlchemy async database session.
 
     Returns:
-        List[DbOrganisation]: A list of organization records from the database.
+        OrganisationPage: The organizations, with only listed fields, and the
+            after cursor for the next page, or null if this is the last.
+    """
+    organizations = await organization_crud.get_organisations(db, after, limit)
+    # Already encoded by Postgres, so returned as is
+    return Response(content=organizations, media_type="application/json")
+
+
+def organisation_etag(organization_id: int, updated_at) -> str:
+    """Weak ETag for an organization, changing whenever it is updated."""
+    version = int(updated_at.timestamp() * 1_000_000)
+    return f'W/"{organization_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses weak comparison, as If-None-Match does: the header may list tags,
+    with or without the W/ prefix, or be * to match any.
     """
-    organizations = organization_crud.get_organisations(db)
-    return organizations
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
 
 
 @router.get("/{organization_id}")
 async def get_organization_detail(
-    organization_id: int, db: Session = Depends(database.get_db)
+    organization_id: int,
+    request: Request,
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    """Get API for fetching detail about a organiation based on id."""
-    organization = await organization_crud.get_organisation_by_id(db, organization_id)
+    """Get API for fetching detail about a organiation based on id.
+
+    Sets an ETag, and returns 304 Not Modified if it matches If-None-Match.
+    """
+    organization = await organization_crud.get_organisation_json_by_id(
+        db, organization_id
+    )
     if not organization:
         raise HTTPException(status_code=404, detail="Organization not found")
 
-    return organization
+    updated_at, content = organization
+    etag = organisation_etag(organization_id, updated_at)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.post("/")
@@ -72,7 +117,8 @@ async def create_organization(
     description: str = Form(None),  # Optional field for organization description
     url: str = Form(None),  # Optional field for organization URL
     logo: UploadFile = File(None),  # Optional field for organization logo
-    db: Session = Depends(database.get_db),  # Dependency for database session
+    # Dependency for database session
+    db: AsyncSession = Depends(database.get_async_db),
 ):
     """Create an organization with the given details.
 
@@ -81,13 +127,13 @@ async def create_organization(
         description (str): The description of the organization. Optional.
         url (str): The URL of the organization. Optional.
         logo (UploadFile): The logo of the organization. Optional.
-        db (Session): The database session. Dependency.
+        db (AsyncSession): The database session. Dependency.
 
     Returns:
         dict: A dictionary with a message indicating successful creation of the organization.
     """
     # Check if the organization with the same already exists
-    if await organization_crud.get_organisation_by_name(db, name=name):
+    if await organization_crud.get_organisation_by_name(db, name=name) is not None:
         raise HTTPException(
             status_code=400, detail=f"Organization already exists with the name {name}"
         )
@@ -104,21 +150,17 @@ async def update_organization(
     description: str = Form(None),
     url: str = Form(None),
     logo: UploadFile = File(None),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
     """PUT API to update the details of an organization."""
-    try:
-        organization = await organization_crud.update_organization_info(
-            db, organization_id, name, description, url, logo
-        )
-        return organization
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error updating organization: {e}")
+    return await organization_crud.update_organization_info(
+        db, organization_id, name, description, url, logo
+    )
 
 
 @router.delete("/{organization_id}")
 async def delete_organisations(
-    organization_id: int, db: Session = Depends(database.get_db)
+    organization_id: int, db: AsyncSession = Depends(database.get_async_db)
 ):
     """Upload an image file.
 
@@ -131,11 +173,7 @@ async def delete_organisations(
     Returns:
         str: The filename of the uploaded image.
     """
-    organization = await organization_crud.get_organisation_by_id(db, organization_id)
-
-    if not organization:
+    if not await organization_crud.delete_organisation(db, organization_id):
         raise HTTPException(status_code=404, detail="Organization not found")
 
-    db.delete(organization)
-    db.commit()
     return {"Message": "Organization Deleted Successfully."}
@@ -15,6 +15,8 @@
 #     You should have received a copy of the GNU General Public License
 #     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
 #
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 
@@ -27,9 +29,42 @@ class Organisation(BaseModel):
         description (str): The description of the organization.
         url (str): The URL of the organization's website.
     """
+
     # id: int
     slug: str
     name: str
     description: str
     url: str
     # type: int
+
+
+class OrganisationListItem(BaseModel):
+    """An organization as shown in the organization list.
+
+    Attributes:
+        id (int): The ID of the organization.
+        name (str): The name of the organization.
+        slug (str): The unique identifier (slug) for the organization.
+        logo (str): The filename of the organization's logo.
+        description (str): The description of the organization.
+        url (str): The URL of the organization's website.
+    """
+
+    id: int
+    name: str
+    slug: str
+    logo: Optional[str] = None
+    description: Optional[str] = None
+    url: Optional[str] = None
+
+
+class OrganisationPage(BaseModel):
+    """A page of the organization list.
+
+    Attributes:
+        items (List[OrganisationListItem]): The organizations in this page.
+        next (int): The after cursor for the next page, or None if last.
+    """
+
+    items: List[OrganisationListItem]
+    next: Optional[int] = None
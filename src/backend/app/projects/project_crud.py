@@ -49,7 +49,7 @@ from shapely import wkt
 from shapely.geometry import MultiPolygon, Polygon, mapping, shape
 from sqlalchemy import and_, column, func, inspect, select, table, text
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql import text
 
 from ..central import central_crud
@@ -64,6 +64,11 @@ QR_CODES_DIR = "QR_codes/"
 TASK_GEOJSON_DIR = "geojson/"
 TILESDIR = "/opt/tiles"
 
+# For queries returning projects with their tasks, as app projects do
+PROJECT_TASKS_LOADER = selectinload(db_models.DbProject.tasks).joinedload(
+    db_models.DbTask.lock_holder
+)
+
 
 def get_projects(
     db: Session,
@@ -93,24 +98,16 @@ def get_projects(
     if hashtags:
         filters.append(db_models.DbProject.hashtags.op("&&")(hashtags))
 
+    query = db.query(db_models.DbProject)
     if len(filters) > 0:
-        db_projects = (
-            db.query(db_models.DbProject)
-            .filter(and_(*filters))
-            .order_by(db_models.DbProject.id.asc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = query.filter(and_(*filters))
+    if not db_objects:
+        # Raw db objects are used for summaries, which don't need all tasks
+        query = query.options(PROJECT_TASKS_LOADER)
 
-    else:
-        db_projects = (
-            db.query(db_models.DbProject)
-            .order_by(db_models.DbProject.id.asc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+    db_projects = (
+        query.order_by(db_models.DbProject.id.asc()).offset(skip).limit(limit).all()
+    )
     if db_objects:
         return db_projects
     return convert_to_app_projects(db_projects)
@@ -150,6 +147,7 @@ def get_project_by_id_w_all_tasks(db: Session, project_id: int):
     """
     db_project = (
         db.query(db_models.DbProject)
+        .options(PROJECT_TASKS_LOADER)
         .filter(db_models.DbProject.id == project_id)
         .first()
     )
@@ -178,6 +176,7 @@ def get_project(db: Session, project_id: int):
 def get_project_by_id(db: Session, project_id: int):
     db_project = (
         db.query(db_models.DbProject)
+        .options(PROJECT_TASKS_LOADER)
         .filter(db_models.DbProject.id == project_id)
         .order_by(db_models.DbProject.id)
         .first()
@@ -439,6 +438,7 @@ def upload_xlsform(
         )
         db.execute(sql)
         db.commit()
+        central_crud.clear_form_list_cache()
         return True
     except Exception as e:
         raise HTTPException(status=400, detail={"message": str(e)}) from e
@@ -798,7 +798,7 @@ def process_polygon(
         query = text(
             f"""
                     DELETE FROM ways_poly
-                    WHERE NOT ST_Within(ST_Centroid(ways_poly.geom), (SELECT geom FROM project_aoi WHERE project_id = '{project_id}'));
+                    WHERE NOT ST_Within(ways_poly.centroid, (SELECT geom FROM project_aoi WHERE project_id = '{project_id}'));
                 """
         )
         result = db.execute(query)
@@ -965,24 +965,24 @@ def update_project_boundary(
     ).delete()
 
     tasks = eval(result)
+    task_mappings = []
     for poly in tasks["features"]:
         log.debug(poly)
         task_name = str(poly["properties"]["id"])
-        db_task = db_models.DbTask(
-            project_id=project_id,
-            project_task_name=task_name,
-            outline=wkblib.dumps(shape(poly["geometry"]), hex=True),
-            # qr_code=db_qr,
-            # qr_code_id=db_qr.id,
-            # project_task_index=feature["properties"]["fid"],
-            project_task_index=1,
-            # geometry_geojson=geojson.dumps(task_geojson),
-            # initial_feature_count=len(task_geojson["features"]),
+        task_mappings.append(
+            {
+                "project_id": project_id,
+                "project_task_name": task_name,
+                "outline": shape(poly["geometry"]),
+                # "project_task_index": feature["properties"]["fid"],
+                "project_task_index": 1,
+                # "initial_feature_count": len(task_geojson["features"]),
+            }
         )
-        db.add(db_task)
-        db.commit()
+    db_models.DbTask.bulk_copy(db, task_mappings)
+    db.commit()
 
-        # FIXME: write to tasks table
+    # FIXME: write to tasks table
     return True
 
 
@@ -1204,6 +1204,7 @@ def read_xlsforms(
         db.execute(sql)
         db.commit()
 
+    central_crud.clear_form_list_cache()
     return xlsforms
 
 
@@ -1220,10 +1221,10 @@ def get_odk_id_for_project(db: Session, project_id: int):
     project = table(
         "projects",
         column("odkid"),
+        column("id"),
     )
 
-    where = f"id={project_id}"
-    sql = select(project).where(text(where))
+    sql = select(project.c.odkid).where(project.c.id == project_id)
     log.info(str(sql))
     result = db.execute(sql)
 
@@ -1272,6 +1273,7 @@ def upload_custom_data_extracts(
     # # Remove anything in the data extract not in the choices sheet.
     # cleaned_data = cleaned.cleanData(features_data)
 
+    feature_mappings = []
     for feature in features_data["features"]:
         feature_shape = shape(feature["geometry"])
 
@@ -1281,17 +1283,16 @@ def upload_custom_data_extracts(
         # If the osm extracts contents do not have a title, provide an empty text for that.
         feature["properties"]["title"] = ""
 
-        feature_shape = shape(feature["geometry"])
+        feature_mappings.append(
+            {
+                "project_id": project_id,
+                "geometry": feature_shape,
+                "properties": feature["properties"],
+            }
+        )
 
-        wkb_element = from_shape(feature_shape, srid=4326)
-        feature_mapping = {
-            "project_id": project_id,
-            "geometry": wkb_element,
-            "properties": feature["properties"],
-        }
-        featuree = db_models.DbFeatures(**feature_mapping)
-        db.add(featuree)
-        db.commit()
+    db_models.DbFeatures.bulk_copy(db, feature_mappings)
+    db.commit()
 
     return True
 
@@ -1347,20 +1348,21 @@ def generate_task_files(
     # Get the features for this task.
     # Postgis query to filter task inside this task outline and of this project
     # Update those features and set task_id
+    # Filtered on project_id directly, so only its features partition is scanned
     query = text(
-        f"""UPDATE features
-                SET task_id={task_id}
-                WHERE id IN (
-                    SELECT id
-                    FROM features
-                    WHERE project_id={project_id}
-                    AND ST_IsValid(geometry)
-                    AND ST_IsValid('{task.outline}'::Geometry)
-                    AND ST_Contains('{task.outline}'::Geometry, ST_Centroid(geometry))
-                )"""
+        """UPDATE features
+                SET task_id = :task_id
+                WHERE project_id = :project_id
+                AND ST_IsValid(geometry)
+                AND ST_IsValid(CAST(:outline AS geometry))
+                AND ST_Contains(CAST(:outline AS geometry), ST_Centroid(geometry))
+        """
     )
 
-    result = db.execute(query)
+    result = db.execute(
+        query,
+        {"task_id": task_id, "project_id": project_id, "outline": str(task.outline)},
+    )
 
     # Get the geojson of those features for this task.
     query = text(
@@ -1472,11 +1474,11 @@ def generate_appuser_files(
             column("id"),
             column("odk_central_url"),
             column("odk_central_user"),
-            column("odk_central_password"),
+            # Typed, so the password is decrypted when selected
+            column("odk_central_password", db_models.EncryptedString),
             column("outline"),
         )
 
-        where = f"id={project_id}"
         sql = select(
             project.c.project_name_prefix,
             project.c.xform_title,
@@ -1485,7 +1487,7 @@ def generate_appuser_files(
             project.c.odk_central_user,
             project.c.odk_central_password,
             geoalchemy2.functions.ST_AsGeoJSON(project.c.outline).label("outline"),
-        ).where(text(where))
+        ).where(project.c.id == project_id)
         result = db.execute(sql)
 
         # There should only be one match
@@ -1572,7 +1574,7 @@ def generate_appuser_files(
                     feature_mappings.append(feature_mapping)
 
                 # Bulk insert the osm extracts into the db.
-                db.bulk_insert_mappings(db_models.DbFeatures, feature_mappings)
+                db_models.DbFeatures.bulk_copy(db, feature_mappings)
 
             # Generating QR Code, XForm and uploading OSM Extracts to the form.
             # Creating app users and updating the role of that user.
@@ -1607,9 +1609,10 @@ def generate_appuser_files(
     except Exception as e:
         log.warning(str(e))
 
-        # Update background task status to FAILED
+        # Update background task status to FAILED, without the error text,
+        # which is shown to users and may include query text from the database
         update_background_task_status_in_database(
-            db, background_task_id, 2, str(e)
+            db, background_task_id, 2, "Failed to generate app user files"
         )  # 2 is FAILED
 
 
@@ -1662,9 +1665,8 @@ def get_project_geometry(db: Session, project_id: int):
         str: A geojson of the project outline.
     """
     projects = table("projects", column("outline"), column("id"))
-    where = f"projects.id={project_id}"
     sql = select(geoalchemy2.functions.ST_AsGeoJSON(projects.c.outline)).where(
-        text(where)
+        projects.c.id == project_id
     )
     result = db.execute(sql)
     # There should only be one match
@@ -1686,8 +1688,9 @@ def get_task_geometry(db: Session, project_id: int):
         str: A geojson of the task boundaries
     """
     tasks = table("tasks", column("outline"), column("project_id"), column("id"))
-    where = f"project_id={project_id}"
-    sql = select(geoalchemy2.functions.ST_AsGeoJSON(tasks.c.outline)).where(text(where))
+    sql = select(geoalchemy2.functions.ST_AsGeoJSON(tasks.c.outline)).where(
+        tasks.c.project_id == project_id
+    )
     result = db.execute(sql)
 
     features = []
@@ -1739,9 +1742,8 @@ def create_task_grid(db: Session, project_id: int, delta: int):
     try:
         # Query DB for project AOI
         projects = table("projects", column("outline"), column("id"))
-        where = f"projects.id={project_id}"
         sql = select(geoalchemy2.functions.ST_AsGeoJSON(projects.c.outline)).where(
-            text(where)
+            projects.c.id == project_id
         )
         result = db.execute(sql)
         # There should only be one match
@@ -2330,12 +2332,11 @@ async def update_project_form(
 
     extract_polygon = True if project.data_extract_type == "polygon" else False
 
-    project = table("projects", column("outline"))
+    project = table("projects", column("outline"), column("id"))
 
-    # where = f"id={project_id}
     sql = select(
         geoalchemy2.functions.ST_AsGeoJSON(project.c.outline).label("outline"),
-    ).where(text(f"id={project_id}"))
+    ).where(project.c.id == project_id)
     result = db.execute(sql)
     project_outline = result.first()
 
@@ -2374,15 +2375,9 @@ async def update_project_form(
         updated_outline_geojson["features"].append(feature)
         feature_mappings.append(feature_mapping)
 
-        # Insert features into db
-        db_feature = db_models.DbFeatures(
-            project_id=project_id,
-            category_title=category,
-            geometry=wkb_element,
-            properties=feature["properties"],
-        )
-        db.add(db_feature)
-        db.commit()
+    # Insert features into db
+    db_models.DbFeatures.bulk_copy(db, feature_mappings)
+    db.commit()
 
     tasks_list = tasks_crud.get_task_lists(db, project_id)
 
@@ -2392,19 +2387,23 @@ async def update_project_form(
         # Get the features for this task.
         # Postgis query to filter task inside this task outline and of this project
         # Update those features and set task_id
+        # Filtered on project_id directly, so only its features partition is scanned
         query = text(
-            f"""UPDATE features
-                    SET task_id={task}
-                    WHERE id in (
-                    
-                    SELECT id
-                    FROM features
-                    WHERE project_id={project_id} and ST_Intersects(geometry, '{task_obj.outline}'::Geometry)
-
-                    )"""
+            """UPDATE features
+                    SET task_id = :task_id
+                    WHERE project_id = :project_id
+                    AND ST_Intersects(geometry, CAST(:outline AS geometry))
+            """
         )
 
-        result = db.execute(query)
+        result = db.execute(
+            query,
+            {
+                "task_id": task,
+                "project_id": project_id,
+                "outline": str(task_obj.outline),
+            },
+        )
 
         # Get the geojson of those features for this task.
         query = text(
@@ -99,8 +99,11 @@ async def get_projet_details(project_id: int, db: Session = Depends(database.get
     )
 
     # Features count
-    query = f"select count(*) from features where project_id={project_id} and task_id is not null"
-    result = db.execute(query)
+    query = text(
+        "select count(*) from features"
+        " where project_id = :project_id and task_id is not null"
+    )
+    result = db.execute(query, {"project_id": project_id})
     features = result.fetchone()[0]
 
     return {
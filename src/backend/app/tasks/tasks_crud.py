@@ -24,8 +24,8 @@ from geojson import dump
 from loguru import logger as log
 from osm_fieldwork.make_data_extract import PostgresClient
 from shapely.geometry import shape
-from sqlalchemy import column, select, table
-from sqlalchemy.orm import Session
+from sqlalchemy import column, table, update
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import text
 
 from app.config import settings
@@ -44,8 +44,8 @@ from ..users import user_crud
 
 
 async def get_task_count_in_project(db: Session, project_id: int):
-    query = text(f"""select count(*) from tasks where project_id = {project_id}""")
-    result = db.execute(query)
+    query = text("select count(*) from tasks where project_id = :project_id")
+    result = db.execute(query, {"project_id": project_id})
     return result.fetchone()[0]
 
 
@@ -82,24 +82,24 @@ def get_tasks(
     Returns:
         List[Task]: List of Task objects.
     """
+    # convert_to_app_tasks reads the lock holder of every task
+    query = db.query(db_models.DbTask).options(joinedload(db_models.DbTask.lock_holder))
     if project_id:
         db_tasks = (
-            db.query(db_models.DbTask)
-            .filter(db_models.DbTask.project_id == project_id)
+            query.filter(db_models.DbTask.project_id == project_id)
             .offset(skip)
             .limit(limit)
             .all()
         )
     elif user_id:
         db_tasks = (
-            db.query(db_models.DbTask)
-            .filter(db_models.DbTask.locked_by == user_id)
+            query.filter(db_models.DbTask.locked_by == user_id)
             .offset(skip)
             .limit(limit)
             .all()
         )
     else:
-        db_tasks = db.query(db_models.DbTask).offset(skip).limit(limit).all()
+        db_tasks = query.offset(skip).limit(limit).all()
     return convert_to_app_tasks(db_tasks)
 
 
@@ -205,13 +205,11 @@ def update_qrcode(
     Returns:
         bool: True if the update was successful, False otherwise.
     """
-    task = table("tasks", column("qr_code_id"), column("id"))
-    where = f"task.c.id={task_id}"
-    value = {"qr_code_id": qr_id}
-    sql = select(
-        geoalchemy2.functions.update(task.c.qr_code_id)
-        .where(text(where))
-        .values(text(value))
+    task = table("tasks", column("qr_code_id"), column("id"), column("project_id"))
+    sql = (
+        update(task)
+        .where(task.c.id == task_id, task.c.project_id == project_id)
+        .values(qr_code_id=qr_id)
     )
     log.info(str(sql))
     result = db.execute(sql)
@@ -415,8 +413,10 @@ async def update_task_files(
     outfile = f"/tmp/test_project_{category}.geojson"
 
     # Delete all tasks of the project if there are some
+    # project_id limits the delete to the project's features partition
     db.query(db_models.DbFeatures).filter(
-        db_models.DbFeatures.task_id == task_id
+        db_models.DbFeatures.project_id == project_id,
+        db_models.DbFeatures.task_id == task_id,
     ).delete()
 
     # OSM Extracts
@@ -431,6 +431,7 @@ async def update_task_files(
     updated_outline_geojson = {"type": "FeatureCollection", "features": []}
 
     # Collect feature mappings for bulk insert
+    feature_mappings = []
     for feature in outline_geojson["features"]:
         # If the osm extracts contents do not have a title, provide an empty text for that.
         feature["properties"]["title"] = ""
@@ -440,13 +441,16 @@ async def update_task_files(
         wkb_element = from_shape(feature_shape, srid=4326)
         updated_outline_geojson["features"].append(feature)
 
-        db_feature = db_models.DbFeatures(
-            project_id=project_id,
-            geometry=wkb_element,
-            properties=feature["properties"],
+        feature_mappings.append(
+            {
+                "project_id": project_id,
+                "geometry": wkb_element,
+                "properties": feature["properties"],
+            }
         )
-        db.add(db_feature)
-        db.commit()
+
+    db_models.DbFeatures.bulk_copy(db, feature_mappings)
+    db.commit()
 
     # Update task_polygons file containing osm extracts with the new geojson contents containing title in the properties.
     with open(task_polygons, "w") as jsonfile:
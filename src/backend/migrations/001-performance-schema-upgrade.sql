@@ -0,0 +1,282 @@
+-- Upgrade an existing FMTM database to the current schema.
+--
+-- New databases get this schema from create_all on startup, so this is only
+-- needed for databases created before the performance changes. It runs in a
+-- single transaction, so a failure leaves the database untouched.
+--
+-- The ODK Central passwords are encrypted in place with pgcrypto, so the key
+-- must match ENCRYPTION_KEY (or OSM_SECRET_KEY when it is unset):
+--
+--     psql -U fmtm -d fmtm -v ON_ERROR_STOP=1 -v encryption_key="$ENCRYPTION_KEY" \
+--         -f src/backend/migrations/001-performance-schema-upgrade.sql
+--
+-- Stop the backend first: features is rebuilt as a partitioned table.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+
+-- organisations: updated_at for ETags, case-insensitive unique name
+
+ALTER TABLE organisations
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITHOUT TIME ZONE
+        DEFAULT timezone('utc', now()) NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_organisations_name_lower
+    ON organisations (lower(name)) INCLUDE (id);
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = timezone('utc', now());
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS organisations_updated_at ON organisations;
+CREATE TRIGGER organisations_updated_at
+BEFORE UPDATE ON organisations
+FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+CREATE INDEX IF NOT EXISTS idx_organisation_managers_user_id
+    ON organisation_managers (user_id) INCLUDE (organisation_id);
+
+
+-- users.projects_mapped array -> user_projects_mapped association table
+
+CREATE TABLE IF NOT EXISTS user_projects_mapped (
+    user_id BIGINT NOT NULL,
+    project_id INTEGER NOT NULL,
+    PRIMARY KEY (user_id, project_id),
+    FOREIGN KEY(user_id) REFERENCES users (id),
+    FOREIGN KEY(project_id) REFERENCES projects (id)
+);
+CREATE INDEX IF NOT EXISTS idx_user_projects_mapped_project_id
+    ON user_projects_mapped (project_id);
+
+INSERT INTO user_projects_mapped (user_id, project_id)
+SELECT DISTINCT users.id, mapped.project_id
+FROM users
+CROSS JOIN LATERAL unnest(users.projects_mapped) AS mapped(project_id)
+JOIN projects ON projects.id = mapped.project_id
+ON CONFLICT DO NOTHING;
+
+ALTER TABLE users DROP COLUMN projects_mapped;
+
+
+-- projects: task status counters, encrypted ODK password, indexes
+
+ALTER TABLE projects
+    ADD COLUMN IF NOT EXISTS tasks_mapped INTEGER DEFAULT '0' NOT NULL,
+    ADD COLUMN IF NOT EXISTS tasks_validated INTEGER DEFAULT '0' NOT NULL,
+    ADD COLUMN IF NOT EXISTS tasks_bad INTEGER DEFAULT '0' NOT NULL;
+
+UPDATE projects SET
+    tasks_mapped = counts.mapped,
+    tasks_validated = counts.validated,
+    tasks_bad = counts.bad
+FROM (
+    SELECT
+        project_id,
+        count(*) FILTER (WHERE task_status = 'MAPPED') AS mapped,
+        count(*) FILTER (WHERE task_status = 'VALIDATED') AS validated,
+        count(*) FILTER (WHERE task_status = 'BAD') AS bad
+    FROM tasks
+    GROUP BY project_id
+) AS counts
+WHERE projects.id = counts.project_id;
+
+ALTER TABLE projects
+    ALTER COLUMN odk_central_password TYPE BYTEA
+    USING pgp_sym_encrypt(odk_central_password, :'encryption_key');
+
+DROP INDEX IF EXISTS idx_geometry;
+CREATE INDEX IF NOT EXISTS idx_projects_created_brin
+    ON projects USING brin (created) WITH (pages_per_range = 32);
+
+
+-- tasks: keep the project counters in sync, covering indexes
+
+CREATE OR REPLACE FUNCTION update_project_task_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE projects SET
+            tasks_mapped = tasks_mapped - (OLD.task_status = 'MAPPED')::int,
+            tasks_validated =
+                tasks_validated - (OLD.task_status = 'VALIDATED')::int,
+            tasks_bad = tasks_bad - (OLD.task_status = 'BAD')::int
+        WHERE id = OLD.project_id
+            AND OLD.task_status IN ('MAPPED', 'VALIDATED', 'BAD');
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE projects SET
+            tasks_mapped = tasks_mapped + (NEW.task_status = 'MAPPED')::int,
+            tasks_validated =
+                tasks_validated + (NEW.task_status = 'VALIDATED')::int,
+            tasks_bad = tasks_bad + (NEW.task_status = 'BAD')::int
+        WHERE id = NEW.project_id
+            AND NEW.task_status IN ('MAPPED', 'VALIDATED', 'BAD');
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tasks_status_counts ON tasks;
+CREATE TRIGGER tasks_status_counts
+AFTER INSERT OR DELETE ON tasks
+FOR EACH ROW EXECUTE FUNCTION update_project_task_counts();
+
+DROP TRIGGER IF EXISTS tasks_status_counts_update ON tasks;
+CREATE TRIGGER tasks_status_counts_update
+AFTER UPDATE OF task_status, project_id ON tasks
+FOR EACH ROW
+WHEN (
+    OLD.task_status IS DISTINCT FROM NEW.task_status
+    OR OLD.project_id IS DISTINCT FROM NEW.project_id
+)
+EXECUTE FUNCTION update_project_task_counts();
+
+DROP INDEX IF EXISTS ix_tasks_locked_by;
+DROP INDEX IF EXISTS ix_tasks_mapped_by;
+DROP INDEX IF EXISTS ix_tasks_validated_by;
+CREATE INDEX IF NOT EXISTS idx_tasks_locked_by_cover
+    ON tasks (locked_by) INCLUDE (project_id, task_status);
+CREATE INDEX IF NOT EXISTS idx_tasks_mapped_by_cover
+    ON tasks (mapped_by) INCLUDE (project_id, task_status);
+CREATE INDEX IF NOT EXISTS idx_tasks_validated_by_cover
+    ON tasks (validated_by) INCLUDE (project_id, task_status);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status
+    ON tasks (project_id, task_status);
+
+
+-- task_history / task_invalidation_history
+
+DROP INDEX IF EXISTS ix_task_history_user_id;
+DROP INDEX IF EXISTS idx_task_history_project_id_user_id;
+CREATE INDEX idx_task_history_project_id_user_id
+    ON task_history (user_id, project_id) INCLUDE (action, action_date);
+CREATE INDEX IF NOT EXISTS idx_task_history_ordered
+    ON task_history (project_id, task_id, action_date DESC);
+CREATE INDEX IF NOT EXISTS idx_task_history_action_date_brin
+    ON task_history USING brin (action_date) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS idx_task_validation_mapper_status_composite;
+DROP INDEX IF EXISTS idx_task_validation_validator_status_composite;
+CREATE INDEX IF NOT EXISTS idx_task_validation_open_by_invalidator
+    ON task_invalidation_history (invalidator_id)
+    INCLUDE (task_id, project_id, invalidated_date) WHERE is_closed = false;
+CREATE INDEX IF NOT EXISTS idx_task_validation_open_by_mapper
+    ON task_invalidation_history (mapper_id)
+    INCLUDE (task_id, project_id, invalidated_date) WHERE is_closed = false;
+
+
+-- project_info: generated full text search vector
+
+DROP INDEX IF EXISTS textsearch_idx;
+ALTER TABLE project_info DROP COLUMN text_searchable;
+ALTER TABLE project_info
+    ADD COLUMN text_searchable TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector(
+            'english',
+            coalesce(name, '') || ' ' || coalesce(short_description, '')
+            || ' ' || coalesce(description, '')
+        )
+    ) STORED;
+CREATE INDEX textsearch_idx ON project_info USING gin (text_searchable);
+
+
+-- project_chat: user ids are BIGINT everywhere else
+
+ALTER TABLE project_chat ALTER COLUMN user_id TYPE BIGINT;
+CREATE INDEX IF NOT EXISTS idx_project_chat_project_time
+    ON project_chat (project_id, time_stamp DESC);
+CREATE INDEX IF NOT EXISTS idx_project_chat_time_stamp_brin
+    ON project_chat USING brin (time_stamp) WITH (pages_per_range = 32);
+
+
+-- mbtiles_path: always belongs to a project, removed with it
+
+DELETE FROM mbtiles_path
+WHERE project_id IS NULL
+    OR NOT EXISTS (SELECT 1 FROM projects WHERE projects.id = mbtiles_path.project_id);
+ALTER TABLE mbtiles_path
+    ALTER COLUMN project_id SET NOT NULL,
+    DROP CONSTRAINT IF EXISTS mbtiles_path_project_id_fkey,
+    ADD CONSTRAINT mbtiles_path_project_id_fkey
+        FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE;
+CREATE INDEX IF NOT EXISTS ix_mbtiles_path_project_id ON mbtiles_path (project_id);
+CREATE INDEX IF NOT EXISTS idx_mbtiles_path_created_at_brin
+    ON mbtiles_path USING brin (created_at) WITH (pages_per_range = 32);
+
+
+-- project_aoi / ways_line / ways_poly: tag indexes, typed osm_id, centroid
+
+CREATE INDEX IF NOT EXISTS idx_project_aoi_tags
+    ON project_aoi USING gin (tags jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_ways_line_tags
+    ON ways_line USING gin (tags jsonb_path_ops);
+
+ALTER TABLE ways_poly
+    ALTER COLUMN osm_id TYPE BIGINT USING nullif(osm_id, '')::bigint,
+    ADD COLUMN IF NOT EXISTS centroid geometry(POINT,4326)
+        GENERATED ALWAYS AS (ST_Centroid(geom)) STORED;
+DROP INDEX IF EXISTS idx_ways_poly_geom;
+CREATE INDEX idx_ways_poly_geom ON ways_poly USING spgist (geom);
+CREATE INDEX IF NOT EXISTS idx_ways_poly_centroid ON ways_poly USING gist (centroid);
+CREATE INDEX IF NOT EXISTS idx_ways_poly_project_id_osm_id
+    ON ways_poly (project_id, osm_id);
+CREATE INDEX IF NOT EXISTS idx_ways_poly_tags
+    ON ways_poly USING gin (tags jsonb_path_ops);
+
+
+-- features: hash partitioned by project_id, matching FEATURES_PARTITIONS
+
+DELETE FROM features WHERE project_id IS NULL;
+
+ALTER TABLE features RENAME TO features_old;
+ALTER TABLE features_old RENAME CONSTRAINT features_pkey TO features_old_pkey;
+ALTER TABLE features_old RENAME CONSTRAINT fk_tasks TO fk_tasks_old;
+ALTER TABLE features_old RENAME CONSTRAINT fk_xform TO fk_xform_old;
+DROP INDEX IF EXISTS idx_features_composite;
+DROP INDEX IF EXISTS idx_features_geometry;
+
+CREATE TABLE features (
+    id INTEGER DEFAULT nextval('features_id_seq') NOT NULL,
+    project_id INTEGER NOT NULL,
+    category_title VARCHAR,
+    task_id INTEGER,
+    properties JSONB,
+    geometry geometry(GEOMETRY,4326),
+    PRIMARY KEY (id, project_id),
+    CONSTRAINT fk_tasks FOREIGN KEY(task_id, project_id) REFERENCES tasks (id, project_id),
+    FOREIGN KEY(project_id) REFERENCES projects (id),
+    CONSTRAINT fk_xform FOREIGN KEY(category_title) REFERENCES xlsforms (title)
+)
+PARTITION BY HASH (project_id);
+
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE features_p%s PARTITION OF features '
+            'FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            remainder, remainder
+        );
+    END LOOP;
+END;
+$$;
+
+INSERT INTO features (id, project_id, category_title, task_id, properties, geometry)
+SELECT id, project_id, category_title, task_id, properties, geometry
+FROM features_old;
+
+ALTER SEQUENCE features_id_seq OWNED BY features.id;
+DROP TABLE features_old;
+
+CREATE INDEX idx_features_composite ON features (task_id, project_id);
+CREATE INDEX idx_features_geometry ON features USING gist (geometry);
+CREATE INDEX idx_features_properties ON features USING gin (properties jsonb_path_ops);
+
+COMMIT;
+
+ANALYZE;
@@ -18,22 +18,19 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy_utils import create_database, database_exists
 
-from app.config import settings
-from app.db.database import Base, get_db
+from app.db.database import Base, async_engine, engine, get_db
 from app.main import api
 
-engine = create_engine(settings.FMTM_DB_URL)
+# The app's own engines, so tests use its JSON, JIT and encryption key setup
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base.metadata.create_all(bind=engine)
 
 
 @pytest.fixture(scope="session")
 def db_engine():
-    engine = create_engine(settings.FMTM_DB_URL)
     if not database_exists:
         create_database(engine.url)
 
@@ -57,6 +54,16 @@ def db(db_engine):
     connection.close()
 
 
+@pytest.fixture(scope="session")
+def async_db_engine():
+    """The engine behind the API's async sessions.
+
+    Not overridden: the app disposes of it on shutdown, so no connection is
+    reused across the event loops of different TestClients.
+    """
+    yield async_engine
+
+
 @pytest.fixture(scope="function")
 def client(db):
     api.dependency_overrides[get_db] = lambda: db
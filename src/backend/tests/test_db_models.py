@@ -0,0 +1,113 @@
+# Copyright (c) 2022, 2023 Humanitarian OpenStreetMap Team
+#
+# This file is part of FMTM.
+#
+#     FMTM is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     FMTM is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
+#
+
+"""Tests for database models, column types and triggers."""
+
+import pytest
+from geoalchemy2.shape import to_shape
+from shapely.geometry import Point
+from sqlalchemy import select, text
+
+from app.db.db_models import BulkCopyMixin, DbFeatures, DbProject, DbTask, DbUser
+from app.models.enums import TaskStatus
+
+
+@pytest.fixture
+def project(db):
+    """A project, rolled back with the rest of the test transaction."""
+    user = DbUser(id=1_000_000_001, username="test_db_models")
+    db_project = DbProject(author=user)
+    db.add(db_project)
+    db.flush()
+    return db_project
+
+
+def test_copy_value_escaping():
+    r"""COPY values escape special characters, with \N for NULL."""
+    columns = DbFeatures.__table__.c
+    row = {"category_title": "a\tb\nc\\d\re", "task_id": None}
+    assert BulkCopyMixin._copy_value(columns.category_title, row) == (
+        "a\\tb\\nc\\\\d\\re"
+    )
+    assert BulkCopyMixin._copy_value(columns.task_id, row) == "\\N"
+    properties = {"properties": {"a": "\t"}}
+    assert BulkCopyMixin._copy_value(columns.properties, properties) == '{"a":"\\\\t"}'
+
+
+def test_bulk_copy_features(db, project):
+    """Batches over the threshold are loaded with COPY, values intact."""
+    rows = [
+        {
+            "project_id": project.id,
+            "properties": {"name": f"a\tb\\{i}"},
+            "geometry": Point(i, i),
+        }
+        for i in range(DbFeatures.COPY_THRESHOLD)
+    ]
+    DbFeatures.bulk_copy(db, rows)
+
+    features = db.scalars(
+        select(DbFeatures)
+        .where(DbFeatures.project_id == project.id)
+        .order_by(DbFeatures.id)
+    ).all()
+    assert len(features) == DbFeatures.COPY_THRESHOLD
+    assert features[1].properties == {"name": "a\tb\\1"}
+    assert to_shape(features[1].geometry).equals(Point(1, 1))
+
+
+def status_counts(db, project):
+    """The mapped, validated and bad task counters stored on a project."""
+    db.refresh(project)
+    return project.tasks_mapped, project.tasks_validated, project.tasks_bad
+
+
+def test_task_status_counters(db, project):
+    """The tasks trigger keeps the project status counters current."""
+    tasks = [
+        DbTask(id=i, project_id=project.id, task_status=TaskStatus.READY)
+        for i in range(1, 4)
+    ]
+    db.add_all(tasks)
+    db.flush()
+
+    tasks[0].task_status = TaskStatus.MAPPED
+    tasks[1].task_status = TaskStatus.VALIDATED
+    tasks[2].task_status = TaskStatus.BAD
+    db.flush()
+    assert status_counts(db, project) == (1, 1, 1)
+
+    tasks[0].task_status = TaskStatus.VALIDATED
+    db.delete(tasks[2])
+    db.flush()
+    assert status_counts(db, project) == (0, 2, 0)
+
+
+def test_encrypted_string_round_trip(db, project):
+    """ODK passwords are stored encrypted, and read back as plain text."""
+    project.odk_central_password = "secret"
+    db.flush()
+
+    stored = db.scalar(
+        text("SELECT odk_central_password FROM projects WHERE id = :id"),
+        {"id": project.id},
+    )
+    assert b"secret" not in bytes(stored)
+
+    db.expire(project)
+    assert project.odk_central_password == "secret"
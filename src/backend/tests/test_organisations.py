@@ -0,0 +1,149 @@
+# Copyright (c) 2022, 2023 Humanitarian OpenStreetMap Team
+#
+# This file is part of FMTM.
+#
+#     FMTM is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     FMTM is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
+#
+
+"""Tests for organisation endpoints."""
+
+import pytest
+from fastapi import status
+from sqlalchemy import delete, event, func, insert, select
+
+from app.db.db_models import DbOrganisation
+from app.organization.organization_crud import MAX_LOGO_SIZE
+from app.organization.organization_routes import etag_matches
+
+
+@pytest.fixture
+def organisations(db_engine):
+    """Three committed organisations, visible to the app's own sessions."""
+    with db_engine.begin() as conn:
+        ids = conn.scalars(
+            insert(DbOrganisation).returning(DbOrganisation.id),
+            [{"name": f"Test Org {i}", "slug": f"test-org-{i}"} for i in range(3)],
+        ).all()
+
+    yield sorted(ids)
+
+    with db_engine.begin() as conn:
+        conn.execute(delete(DbOrganisation).where(DbOrganisation.id.in_(ids)))
+
+
+@pytest.fixture
+def statements(client, async_db_engine):
+    """The SQL statements executed by the app during a test, after startup."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = async_db_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_list_organisations_single_query(organisations, client, statements):
+    """A page of organisations is built in one query."""
+    response = client.get("/organization/", params={"after": organisations[0] - 1})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+
+
+def test_list_organisations_pages(organisations, client):
+    """Pages follow the after cursor, with no next after the last."""
+    after = organisations[0] - 1
+    response = client.get("/organization/", params={"after": after, "limit": 2})
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == organisations[:2]
+    assert set(page["items"][0]) == {"id", "name", "slug", "logo", "description", "url"}
+    assert page["next"] == organisations[1]
+
+    response = client.get("/organization/", params={"after": page["next"], "limit": 2})
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == organisations[2:]
+    assert page["next"] is None
+
+
+def test_list_organisations_limit_bounds(client):
+    """The page size must be at least one."""
+    response = client.get("/organization/", params={"limit": 0})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_organisation_detail_etag(organisations, client, statements):
+    """Unchanged organisations return 304, until they are updated."""
+    url = f"/organization/{organisations[0]}"
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "Test Org 0"
+    assert len(statements) == 1
+    etag = response.headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    client.patch(f"{url}/", data={"description": "Changed"})
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['W/"1-5"', '"1-5"', '"1-4", W/"1-5"', "*"],
+)
+def test_etag_matches(if_none_match):
+    """If-None-Match may list weak or strong tags, or be * to match any."""
+    assert etag_matches(if_none_match, 'W/"1-5"')
+    assert not etag_matches('W/"1-4", "2-5"', 'W/"1-5"')
+
+
+def test_organisation_detail_not_found(client):
+    """Unknown organisations return 404."""
+    response = client.get("/organization/0")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_update_organisation_duplicate_name(organisations, client):
+    """Renaming to a taken name, in any case, conflicts."""
+    response = client.patch(
+        f"/organization/{organisations[1]}/", data={"name": "test org 0"}
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+def test_delete_organisation(organisations, client):
+    """Deleting an organisation twice returns 404 the second time."""
+    response = client.delete(f"/organization/{organisations[0]}")
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.delete(f"/organization/{organisations[0]}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_create_organisation_oversized_logo(client, db_engine):
+    """Oversized logos are rejected, without creating the organisation."""
+    name = "Test Org Oversized Logo"
+    logo = ("logo.png", b"0" * (MAX_LOGO_SIZE + 1), "image/png")
+    response = client.post("/organization/", data={"name": name}, files={"logo": logo})
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    with db_engine.connect() as conn:
+        query = select(func.count()).where(DbOrganisation.name == name)
+        assert conn.scalar(query) == 0
@@ -4,6 +4,7 @@ import {
   ProjectDetailsModel,
   FormCategoryListModel,
   OrganisationListModel,
+  OrganisationListPageModel,
 } from '../models/createproject/createProjectModel';
 import enviroment from '../environment';
 import { CommonActions } from '../store/slices/CommonSlice';
@@ -208,8 +209,15 @@ const OrganisationService: Function = (url: string) => {
 
     const getOrganisationList = async (url) => {
       try {
-        const getOrganisationListResponse = await axios.get(url);
-        const resp: OrganisationListModel = getOrganisationListResponse.data;
+        // The list is paged, so follow the next cursor until the last page
+        const resp: OrganisationListModel[] = [];
+        let after: number | null = 0;
+        while (after !== null) {
+          const getOrganisationListResponse = await axios.get(url, { params: { after } });
+          const page: OrganisationListPageModel = getOrganisationListResponse.data;
+          resp.push(...page.items);
+          after = page.next;
+        }
         dispatch(CreateProjectActions.GetOrganisationList(resp));
       } catch (error) {
         dispatch(CreateProjectActions.GetOrganizationListLoading(false));
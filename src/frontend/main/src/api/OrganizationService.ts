@@ -1,6 +1,6 @@
 import axios from 'axios';
 import { HomeProjectCardModel } from '../models/home/homeModel';
-import { GetOrganizationDataModel, OrganizationModal } from '../models/organization/organizationModel';
+import { GetOrganizationDataModel, GetOrganizationPageModel, OrganizationModal } from '../models/organization/organizationModel';
 import { CommonActions } from '../store/slices/CommonSlice';
 import { OrganizationAction } from '../store/slices/organizationSlice';
 
@@ -43,8 +43,15 @@ export const OrganizationDataService: Function = (url: string) => {
     dispatch(OrganizationAction.GetOrganizationDataLoading(true));
     const getOrganizationData = async (url) => {
       try {
-        const getOrganizationDataResponse = await axios.get(url);
-        const response: GetOrganizationDataModel = getOrganizationDataResponse.data;
+        // The list is paged, so follow the next cursor until the last page
+        const response: GetOrganizationDataModel[] = [];
+        let after: number | null = 0;
+        while (after !== null) {
+          const getOrganizationDataResponse = await axios.get(url, { params: { after } });
+          const page: GetOrganizationPageModel = getOrganizationDataResponse.data;
+          response.push(...page.items);
+          after = page.next;
+        }
         dispatch(OrganizationAction.GetOrganizationsData(response));
       } catch (error) {
         dispatch(OrganizationAction.GetOrganizationDataLoading(false));
@@ -79,3 +79,7 @@ export interface OrganisationListModel {
   logo: string;
   url: string;
 }
+export interface OrganisationListPageModel {
+  items: OrganisationListModel[];
+  next: number | null;
+}
@@ -30,6 +30,10 @@ export interface GetOrganizationDataModel {
   logo: string;
   url: string;
 }
+export interface GetOrganizationPageModel {
+  items: GetOrganizationDataModel[];
+  next: number | null;
+}
 export interface PostOrganizationDataModel {
   name: string;
   slug: string;